@@ -0,0 +1,56 @@
+"""Benchmark parse_webvtt on a synthetic rolling-caption file or a real one.
+
+Usage (from the repository root):
+
+    python benchmarks/bench_webvtt.py [--cues 60000] [--file subs.vtt] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from extractors.helpers import parse_webvtt, segments_to_plain_text  # noqa: E402
+
+def _fmt_ts(ms: int) -> str:
+    return f"{ms // 3600000:02d}:{ms // 60000 % 60:02d}:{ms // 1000 % 60:02d}.{ms % 1000:03d}"
+
+def build_rolling_vtt(cues: int) -> bytes:
+    parts = ["WEBVTT\nKind: captions\nLanguage: en\n"]
+    prev = "intro"
+    start = 0
+    for idx in range(cues):
+        line = f"caption {idx} <c>with</c> some &amp; rolling text"
+        parts.append(
+            f"\n{idx}\n{_fmt_ts(start)} --> {_fmt_ts(start + 2000)} align:start position:0%\n"
+            f"{prev}\n{line}\n"
+        )
+        prev = line
+        start += 2000
+    return "".join(parts).encode("utf-8")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the WebVTT subtitle parser.")
+    parser.add_argument("--cues", type=int, default=60000, help="Cues in the synthetic file.")
+    parser.add_argument("--file", help="Benchmark this WebVTT file instead of a synthetic one.")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs; the best is reported.")
+    args = parser.parse_args()
+
+    data = Path(args.file).read_bytes() if args.file else build_rolling_vtt(args.cues)
+    timings = []
+    for _ in range(args.repeat):
+        started = time.perf_counter()
+        segments = parse_webvtt(data)
+        segments_to_plain_text(segments)
+        timings.append(time.perf_counter() - started)
+
+    best = min(timings)
+    size_mb = len(data) / 1e6
+    print(f"{size_mb:.1f} MB, {len(segments)} segments: best {best:.3f}s ({size_mb / best:.1f} MB/s)")
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,11 @@
-thonimport json
+thonimport html
+import json
 import logging
 import os
 import re
 import time
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 from urllib.parse import parse_qs, urlparse
 
 import requests
@@ -111,22 +112,112 @@ def parse_youtube_video_id(url: str) -> Optional[str]:
         return url
     return None
 
-def strip_vtt_to_plain_text(vtt: str) -> str:
-    lines = vtt.splitlines()
-    filtered: List[str] = []
-    ts_pattern = re.compile(r"^\d{2}:\d{2}:\d{2}\.\d{3} --> ")
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-        if line.upper() == "WEBVTT":
-            continue
-        if ts_pattern.match(line):
+# A cue is its timing line (cue settings are ignored) followed by the payload
+# lines up to the next blank line or timing line. The optional cue identifier
+# before it, and NOTE/STYLE/REGION blocks, never contain "-->" and are skipped
+# by the scan; any other line holding "-->" is reported as ``bad``.
+_VTT_CUE_RE = re.compile(
+    r"^(?:[ \t]*(?:(\d+):)?(\d{2}):(\d{2})\.(\d{3})[ \t]+-->[ \t]+"
+    r"(?:(\d+):)?(\d{2}):(\d{2})\.(\d{3})(?=[ \t\n]|\Z)(?:[ \t][^\n]*)?\n?"
+    r"((?:(?![^\n]*-->)[^\n]+\n?)*)"
+    r"|(?P<bad>[^\n]*-->))",
+    re.MULTILINE,
+)
+_VTT_LEADING_RE = re.compile(r"[\ufeff \t\n]*")
+_VTT_TAG_RE = re.compile(r"<[^>\n]*>")
+# Rolling captions re-show the previous cue's lines in a cue that starts
+# (almost) exactly where the previous one ended.
+_VTT_ROLLING_GAP = 0.05
+# Cues no longer than this that only repeat the previous lines are the
+# transition frames of rolling captions rather than repeated speech.
+_VTT_FLASH_CUE = 0.05
+
+def _vtt_unescape(text: str) -> str:
+    # str.replace covers the entities captions actually use far faster than
+    # html.unescape; "&amp;" goes last so "&amp;lt;" stays a literal "&lt;".
+    text = text.replace("&lt;", "<").replace("&gt;", ">").replace("&nbsp;", " ")
+    if text.count("&") != text.count("&amp;"):
+        return html.unescape(text)
+    return text.replace("&amp;", "&")
+
+def parse_webvtt(data: Union[str, bytes], strict: bool = False) -> List[Dict[str, Any]]:
+    """Parse WebVTT text into ``{"text", "start", "duration"}`` segments.
+
+    Cues are found in a single scan over the text. Cue identifiers,
+    NOTE/STYLE/REGION blocks, cue settings and markup tags are dropped, and
+    lines repeated by rolling captions are merged into the previous segment.
+    Malformed cues and a missing ``WEBVTT`` signature are tolerated unless
+    ``strict`` is set, in which case a ``ValueError`` is raised.
+    """
+    text = data.decode("utf-8", errors="replace") if isinstance(data, bytes) else data
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    pos = _VTT_LEADING_RE.match(text).end()
+    if strict and (
+        not text.startswith("WEBVTT", pos) or text[pos + 6 : pos + 7] not in ("", " ", "\t", "\n")
+    ):
+        raise ValueError("Missing WEBVTT signature")
+
+    segments: List[Dict[str, Any]] = []
+    prev_lines: List[str] = []
+    prev_start_ms = -1
+    prev_end = -1.0
+    for match in _VTT_CUE_RE.finditer(text, pos):
+        if match.group("bad") is not None:
+            if strict:
+                raise ValueError(f"Malformed cue timing line at offset {match.start()}")
             continue
-        if line.isdigit():
+        h1, m1, s1, ms1, h2, m2, s2, ms2, payload = match.group(1, 2, 3, 4, 5, 6, 7, 8, 9)
+        start_ms = ((int(h1 or 0) * 60 + int(m1)) * 60 + int(s1)) * 1000 + int(ms1)
+        end_ms = ((int(h2 or 0) * 60 + int(m2)) * 60 + int(s2)) * 1000 + int(ms2)
+        if strict:
+            if end_ms < start_ms:
+                raise ValueError(f"Cue ends before it starts at offset {match.start()}")
+            if start_ms < prev_start_ms:
+                raise ValueError(f"Cue starts before the previous cue at offset {match.start()}")
+        prev_start_ms = start_ms
+        start = start_ms / 1000
+        end = max(end_ms, start_ms) / 1000
+
+        # Cleaning happens after the cue is matched, so markup and entities
+        # (e.g. "&#10;" or "--&gt;") cannot change the cue structure.
+        if "<" in payload:
+            payload = _VTT_TAG_RE.sub("", payload)
+        if "&" in payload:
+            payload = _vtt_unescape(payload)
+        lines = [" ".join(line.split()) for line in payload.splitlines()]
+        if "" in lines:
+            lines = [line for line in lines if line]
+        if not lines:
             continue
-        filtered.append(line)
-    return " ".join(filtered)
+
+        fresh = lines
+        if segments and start <= prev_end + _VTT_ROLLING_GAP:
+            overlap = min(len(lines), len(prev_lines))
+            while overlap and lines[:overlap] != prev_lines[-overlap:]:
+                overlap -= 1
+            if overlap < len(lines) or end - start <= _VTT_FLASH_CUE:
+                fresh = lines[overlap:]
+        if fresh:
+            segments.append(
+                {"text": " ".join(fresh), "start": start, "duration": round(end - start, 3)}
+            )
+        else:
+            last = segments[-1]
+            last_end = max(last["start"] + last["duration"], end)
+            last["duration"] = round(last_end - last["start"], 3)
+        prev_lines = lines
+        prev_end = end
+
+    return segments
+
+def segments_to_plain_text(segments: Iterable[Dict[str, Any]]) -> str:
+    return " ".join(
+        word for seg in segments for word in (seg.get("text") or "").split()
+    )
+
+def strip_vtt_to_plain_text(vtt: str) -> str:
+    return segments_to_plain_text(parse_webvtt(vtt))
 
 def segments_to_webvtt(segments: Iterable[Dict[str, Any]]) -> str:
     def fmt_ts(seconds: float) -> str:
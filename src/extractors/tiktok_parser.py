@@ -10,7 +10,9 @@ from .helpers import (
     build_proxies,
     get_logger,
     http_get,
-    strip_vtt_to_plain_text,
+    parse_webvtt,
+    segments_to_plain_text,
+    segments_to_webvtt,
 )
 
 class TikTokExtractor:
@@ -37,11 +39,11 @@ class TikTokExtractor:
                 return item
         return None
 
-    def _extract_transcript_from_video(
+    def _extract_transcript_segments(
         self,
         video: Dict[str, Any],
         proxies: Optional[Dict[str, Optional[str]]],
-    ) -> Optional[str]:
+    ) -> List[Dict[str, Any]]:
         subs = (
             video.get("subtitleInfos")
             or video.get("subtitleInfo")
@@ -60,22 +62,37 @@ class TikTokExtractor:
                 continue
             try:
                 resp = http_get(url, proxies=proxies, timeout=20, max_retries=3, logger=self.log)
-                text = resp.text.strip()
-                if text:
-                    if not text.lstrip().upper().startswith("WEBVTT"):
-                        # Assume it's JSON with captions
-                        try:
-                            segments = json.loads(text)
-                            if isinstance(segments, list):
-                                from .helpers import segments_to_webvtt  # local import to avoid cycles
-
-                                return segments_to_webvtt(segments)
-                        except json.JSONDecodeError:
-                            pass
-                    return text
             except Exception as exc:  # noqa: BLE001
                 self.log.warning("Failed to download TikTok subtitle from %s: %s", url, exc)
-        return None
+                continue
+            content = resp.content
+            if not content.strip():
+                continue
+            try:
+                if content.lstrip(b"\xef\xbb\xbf \t\r\n")[:6].upper() == b"WEBVTT":
+                    segments = parse_webvtt(content)
+                else:
+                    # Assume it's JSON with captions
+                    captions = json.loads(content)
+                    if not isinstance(captions, list) or not all(
+                        isinstance(seg, dict) and "text" in seg for seg in captions
+                    ):
+                        raise ValueError("Subtitle JSON is not a list of captions")
+                    segments = [
+                        {
+                            "text": str(seg.get("text") or "").strip(),
+                            "start": float(seg.get("start") or 0.0),
+                            "duration": float(seg.get("duration") or 0.0),
+                        }
+                        for seg in captions
+                    ]
+                    segments = [seg for seg in segments if seg["text"]]
+            except (TypeError, ValueError) as exc:
+                self.log.warning("Failed to parse TikTok subtitle from %s: %s", url, exc)
+                continue
+            if segments:
+                return segments
+        return []
 
     def extract(
         self,
@@ -133,14 +150,15 @@ class TikTokExtractor:
         if author_name and author_name in users:
             author_name = users[author_name].get("nickname") or users[author_name].get("uniqueId") or author_name
 
-        transcript_vtt = self._extract_transcript_from_video(video, proxy_dict)
-        if not transcript_vtt:
-            # Fall back to generating a trivial WebVTT with the description as a single cue
+        segments = self._extract_transcript_segments(video, proxy_dict)
+        if not segments:
+            # Fall back to a single cue holding the description
             desc = (item.get("desc") or "").strip()
             if desc:
-                transcript_vtt = "WEBVTT\n\n00:00:00.000 --> 00:59:59.000\n" + desc + "\n"
+                segments = [{"text": desc, "start": 0.0, "duration": 3599.0}]
 
-        plain_text = strip_vtt_to_plain_text(transcript_vtt) if transcript_vtt else None
+        transcript_vtt = segments_to_webvtt(segments) if segments else None
+        plain_text = segments_to_plain_text(segments) if segments else None
 
         keywords: List[str] = []
         text_extra = item.get("textExtra") or []
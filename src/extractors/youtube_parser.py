@@ -14,6 +14,7 @@ from .helpers import (
     build_proxies,
     get_logger,
     parse_youtube_video_id,
+    segments_to_plain_text,
     segments_to_webvtt,
 )
 
@@ -98,8 +99,7 @@ class YouTubeExtractor:
         )
         transcript_vtt = segments_to_webvtt(segments) if segments else ""
 
-        plain_text = " ".join(seg.get("text", "").replace("\n", " ").strip() for seg in segments)
-        plain_text = " ".join(part for part in plain_text.split() if part)
+        plain_text = segments_to_plain_text(segments)
 
         metadata = self._fetch_metadata(url, proxies=proxies)
         result: Dict[str, Any] = {
@@ -0,0 +1,87 @@
+import pytest
+
+from extractors.helpers import parse_webvtt, segments_to_plain_text, strip_vtt_to_plain_text
+
+def seg(text, start, duration):
+    return {"text": text, "start": start, "duration": duration}
+
+def test_parse_webvtt_skips_identifiers_blocks_and_settings():
+    vtt = (
+        "WEBVTT - title\nKind: captions\n\n"
+        "STYLE\n::cue { color: red }\n\n"
+        "NOTE a comment\nspanning lines\n\n"
+        "intro\n00:00:01.000 --> 00:00:02.500 align:start position:0%\nHello\n\n"
+        "2\n00:00:03.000 --> 00:00:04.000\nworld\n"
+    )
+    assert parse_webvtt(vtt) == [seg("Hello", 1.0, 1.5), seg("world", 3.0, 1.0)]
+
+def test_parse_webvtt_accepts_hourless_timestamps():
+    assert parse_webvtt("WEBVTT\n\n01:02.500 --> 01:03.000\nA\n") == [seg("A", 62.5, 0.5)]
+
+def test_parse_webvtt_accepts_bytes_bom_and_leading_whitespace():
+    data = b"\n  \xef\xbb\xbfWEBVTT\r\n\r\n00:01.000 --> 00:02.000\r\nA\r\n"
+    assert parse_webvtt(data, strict=True) == [seg("A", 1.0, 1.0)]
+
+def test_parse_webvtt_normalizes_mixed_line_endings():
+    vtt = "WEBVTT\r\n\r\n00:00:00.000 --> 00:00:01.000\rA\r\r00:00:01.000 --> 00:00:02.000\r\nB\r\n"
+    assert parse_webvtt(vtt) == [seg("A", 0.0, 1.0), seg("B", 1.0, 1.0)]
+
+def test_parse_webvtt_splits_cues_without_blank_line():
+    vtt = "WEBVTT\n\n00:00:01.000 --> 00:00:02.000\nline\n00:00:02.000 --> 00:00:03.000\nnext\n"
+    assert parse_webvtt(vtt) == [seg("line", 1.0, 1.0), seg("next", 2.0, 1.0)]
+
+def test_parse_webvtt_strips_tags_and_decodes_entities_per_cue():
+    vtt = (
+        "WEBVTT\n\n00:01.000 --> 00:02.000\n"
+        "<v Bob>how</v> are<00:00:01.500><c> you</c> &amp;lt; &lt;i&gt; &eacute;\n\n"
+        "00:03.000 --> 00:04.000\na &#10;&#10;b\n\n"
+        "00:05.000 --> 00:06.000\nx --&gt; y\n"
+    )
+    assert parse_webvtt(vtt, strict=True) == [
+        seg("how are you &lt; <i> é", 1.0, 1.0),
+        seg("a b", 3.0, 1.0),
+        seg("x --> y", 5.0, 1.0),
+    ]
+
+def test_parse_webvtt_merges_rolling_captions():
+    vtt = (
+        "WEBVTT\n\n00:01.000 --> 00:02.000\nA\n\n"
+        "00:02.000 --> 00:02.010\nA\n\n"
+        "00:02.010 --> 00:04.000\nA\nB\n"
+    )
+    assert parse_webvtt(vtt) == [seg("A", 1.0, 1.01), seg("B", 2.01, 1.99)]
+
+def test_parse_webvtt_keeps_repeated_speech():
+    vtt = "WEBVTT\n\n00:01.000 --> 00:02.000\nYeah\n\n00:02.000 --> 00:03.000\nYeah\n"
+    assert parse_webvtt(vtt) == [seg("Yeah", 1.0, 1.0), seg("Yeah", 2.0, 1.0)]
+
+@pytest.mark.parametrize("timing", ["00:00:00.000 --> 00:00:01.0000", "00:00:00.000 --> 00:00:01.000x"])
+def test_parse_webvtt_rejects_trailing_garbage_after_timestamp(timing):
+    vtt = f"WEBVTT\n\n{timing}\nA\n"
+    assert parse_webvtt(vtt) == []
+    with pytest.raises(ValueError, match="Malformed cue timing line"):
+        parse_webvtt(vtt, strict=True)
+
+@pytest.mark.parametrize(
+    "vtt, message",
+    [
+        ("00:01.000 --> 00:02.000\nA\n", "Missing WEBVTT signature"),
+        ("WEBVTT\n\ngarbage --> x\nA\n", "Malformed cue timing line"),
+        ("WEBVTT\n\n00:02.000 --> 00:01.000\nA\n", "ends before it starts"),
+        ("WEBVTT\n\n00:02.000 --> 00:03.000\nA\n\n00:01.000 --> 00:02.000\nB\n", "before the previous cue"),
+    ],
+)
+def test_parse_webvtt_strict_errors(vtt, message):
+    with pytest.raises(ValueError, match=message):
+        parse_webvtt(vtt, strict=True)
+
+def test_parse_webvtt_skips_malformed_cues_when_lenient():
+    vtt = "WEBVTT\n\ngarbage --> x\nA\n\n00:01.000 --> 00:02.000\nok\n"
+    assert parse_webvtt(vtt) == [seg("ok", 1.0, 1.0)]
+
+def test_segments_to_plain_text_collapses_whitespace():
+    segments = [{"text": " Hello\nworld "}, {"text": None}, {"text": "again"}]
+    assert segments_to_plain_text(segments) == "Hello world again"
+
+def test_strip_vtt_to_plain_text_accepts_headerless_input():
+    assert strip_vtt_to_plain_text("00:01.000 --> 00:02.000\nno header\n") == "no header"
@@ -0,0 +1,58 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from extractors import tiktok_parser
+from extractors.tiktok_parser import TikTokExtractor
+
+SUBTITLE_URL = "https://example.com/subs"
+VIDEO_URL = "https://www.tiktok.com/@user/video/1"
+
+def _page(desc="A description"):
+    state = {
+        "ItemModule": {
+            "1": {
+                "id": "1",
+                "desc": desc,
+                "video": {"subtitleInfos": [{"Url": SUBTITLE_URL}]},
+            }
+        }
+    }
+    return f'<script id="SIGI_STATE">{json.dumps(state)}</script>'
+
+@pytest.fixture
+def serve(monkeypatch):
+    def _serve(subtitle: bytes):
+        def fake_get(url, **kwargs):
+            body = subtitle if url == SUBTITLE_URL else _page().encode("utf-8")
+            return SimpleNamespace(content=body, text=body.decode("utf-8", errors="replace"))
+
+        monkeypatch.setattr(tiktok_parser, "http_get", fake_get)
+        return TikTokExtractor().extract(VIDEO_URL)
+
+    return _serve
+
+def test_extract_parses_lowercase_webvtt_signature(serve):
+    result = serve(b"\n webvtt\n\n00:01.000 --> 00:02.000\nHello\n")
+    assert result["transcript"] == "WEBVTT\n\n1\n00:00:01.000 --> 00:00:02.000\nHello\n"
+    assert result["transcript_only_text"] == "Hello"
+
+def test_extract_normalizes_json_captions(serve):
+    captions = [{"text": "Hello", "start": 1, "duration": "1.5"}, {"text": " ", "start": 3}]
+    result = serve(json.dumps(captions).encode("utf-8"))
+    assert result["transcript"] == "WEBVTT\n\n1\n00:00:01.000 --> 00:00:02.500\nHello\n"
+
+@pytest.mark.parametrize(
+    "subtitle",
+    [
+        b'[{"text": ""}, {"text": null}]',
+        b'["a", 1, null]',
+        b'{"text": "not a list"}',
+        b"1\n00:00:01,000 --> 00:00:02,000\nSRT\n",
+    ],
+)
+def test_extract_falls_back_to_description_for_unusable_subtitles(serve, subtitle):
+    result = serve(subtitle)
+    assert result["transcript"] == "WEBVTT\n\n1\n00:00:00.000 --> 00:59:59.000\nA description\n"
+    assert result["transcript_only_text"] == "A description"